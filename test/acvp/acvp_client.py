@@ -9,22 +9,169 @@
 # Invokes `acvp_mldsa{lvl}` under the hood.
 
 import argparse
+import base64
 import hashlib
+import http.client
 import os
 import json
+import mmap
+import re
+import stat
 import sys
 import subprocess
+import threading
+import urllib.parse
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
 
+# orjson is considerably faster than the standard library on the large
+# ACVP JSON files. Use it if available, but do not require it.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Check if we need to use a wrapper for execution (e.g. QEMU)
 exec_prefix = os.environ.get("EXEC_WRAPPER", "")
 exec_prefix = exec_prefix.split(" ") if exec_prefix != "" else []
 
+# Spawn acvp_mldsa{lvl} with close_fds=False: This allows CPython to use the
+# considerably faster posix_spawn() instead of fork() + exec(), and avoids
+# closing all file descriptors in the child. This is safe as file descriptors
+# created by Python are non-inheritable by default (PEP 446), and only
+# stdin/stdout/stderr are passed to the child.
+acvp_close_fds = False
+
+# Matches `key=value` lines in the output of acvp_mldsa{lvl}
+acvp_output_re = re.compile(rb"([A-Za-z_][A-Za-z0-9_]*)=([^\n\r]+)")
+
+# Whether to keep long-running `acvp_mldsa{lvl} server` processes instead of
+# spawning a new process for every test case. Disabled by --no-server.
+use_acvp_server = True
+
+
+def json_loads(data):
+    """Parse JSON from a bytes object."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_load(f):
+    """Parse JSON from a file opened in binary mode."""
+    if orjson is None:
+        return json.load(f)
+    # Let orjson parse directly from a memory mapping of the file instead of
+    # first copying the potentially large file contents into a bytes object.
+    # Only non-empty regular files can be mapped; read anything else (e.g.,
+    # pipes such as /dev/stdin) as usual.
+    st = os.fstat(f.fileno())
+    if not stat.S_ISREG(st.st_mode) or st.st_size == 0:
+        return orjson.loads(f.read())
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        with memoryview(mm) as data:
+            return orjson.loads(data)
+
+
+def json_dump(obj, f):
+    """Write obj as JSON to a file opened in binary mode.
+
+    The output is serialized in one go and written with a single write."""
+    if orjson is not None:
+        data = orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+    else:
+        # Match the compact output of orjson
+        data = (json.dumps(obj, separators=(",", ":")) + "\n").encode("utf-8")
+    f.write(data)
+
+
+def http_get(conn, path):
+    """Send a GET request over the keep-alive connection conn.
+
+    If the server closed a reused connection while it was idle, reconnect
+    and retry once. Returns the response and its body."""
+    reused = conn.sock is not None
+    try:
+        conn.request("GET", path)
+        response = conn.getresponse()
+    except (http.client.RemoteDisconnected, ConnectionResetError):
+        if not reused:
+            raise
+        conn.close()
+        conn.request("GET", path)
+        response = conn.getresponse()
+    return (response, response.read())
+
+
+def download_acvp_file(conn, base_path, data_dir, file_path):
+    """Download a single ACVP test file using the HTTPS connection conn."""
+    local_file = data_dir / file_path
+    local_file.parent.mkdir(parents=True, exist_ok=True)
+
+    try:
+        (response, data) = http_get(conn, f"{base_path}/{file_path}")
+        if response.status != 200:
+            raise Exception(f"HTTP {response.status} {response.reason}")
+        # Verify the file is valid JSON before writing it
+        json_loads(data)
+        local_file.write_bytes(data)
+    except json.JSONDecodeError as e:
+        print(
+            f"Error: Downloaded file {file_path} is not valid JSON: {e}",
+            file=sys.stderr,
+        )
+        conn.close()
+        return False
+    except Exception as e:
+        print(f"Error downloading {file_path}: {e}", file=sys.stderr)
+        local_file.unlink(missing_ok=True)
+        # Reset the connection, so that http.client reopens it for the next
+        # file instead of failing with CannotSendRequest
+        conn.close()
+        return False
+
+    return True
+
+
+def https_connection(host):
+    """Create a HTTPS connection to host.
+
+    Like urllib, honor the https_proxy and no_proxy environment variables:
+    If a proxy is configured for host, tunnel the connection through it."""
+    proxy = urllib.request.getproxies().get("https")
+    if proxy is None or urllib.request.proxy_bypass(host):
+        return http.client.HTTPSConnection(host)
+
+    if "://" not in proxy:
+        proxy = f"http://{proxy}"
+    proxy_url = urllib.parse.urlsplit(proxy)
+    headers = {}
+    if proxy_url.username is not None:
+        credentials = urllib.parse.unquote(proxy_url.username)
+        credentials += ":" + urllib.parse.unquote(proxy_url.password or "")
+        credentials = base64.b64encode(credentials.encode("utf-8")).decode("ascii")
+        headers["Proxy-Authorization"] = f"Basic {credentials}"
+
+    conn = http.client.HTTPSConnection(proxy_url.hostname, proxy_url.port)
+    conn.set_tunnel(host, headers=headers)
+    return conn
+
+
+def download_acvp_files_batch(host, base_path, data_dir, files):
+    """Download ACVP test files over a single keep-alive HTTPS connection."""
+    conn = https_connection(host)
+    try:
+        return all([download_acvp_file(conn, base_path, data_dir, f) for f in files])
+    finally:
+        conn.close()
+
 
 def download_acvp_files(version):
     """Download ACVP test files for the specified version if not present."""
-    base_url = f"https://raw.githubusercontent.com/usnistgov/ACVP-Server/{version}/gen-val/json-files"
+    host = "raw.githubusercontent.com"
+    base_path = f"/usnistgov/ACVP-Server/{version}/gen-val/json-files"
 
     # Files we need to download for ML-KEM
     files_to_download = [
@@ -40,42 +187,39 @@ def download_acvp_files(version):
     data_dir = Path(f"test/acvp/.acvp-data/{version}/files")
     data_dir.mkdir(parents=True, exist_ok=True)
 
+    files_to_download = [f for f in files_to_download if not (data_dir / f).exists()]
+    if len(files_to_download) == 0:
+        return True
+
     for file_path in files_to_download:
-        local_file = data_dir / file_path
-        local_file.parent.mkdir(parents=True, exist_ok=True)
-
-        if not local_file.exists():
-            url = f"{base_url}/{file_path}"
-            print(f"Downloading {file_path}...", file=sys.stderr)
-            try:
-                urllib.request.urlretrieve(url, local_file)
-                # Verify the file is valid JSON
-                with open(local_file, "r") as f:
-                    json.load(f)
-            except json.JSONDecodeError as e:
-                print(
-                    f"Error: Downloaded file {file_path} is not valid JSON: {e}",
-                    file=sys.stderr,
-                )
-                local_file.unlink(missing_ok=True)
-                return False
-            except Exception as e:
-                print(f"Error downloading {file_path}: {e}", file=sys.stderr)
-                local_file.unlink(missing_ok=True)
-                return False
+        print(f"Downloading {file_path}...", file=sys.stderr)
+
+    # The downloads are I/O-bound, so fetch the files concurrently. Each
+    # worker reuses a single HTTPS connection for several files to avoid
+    # paying for a TCP and TLS handshake per file.
+    jobs = min(3, len(files_to_download))
+    batches = [files_to_download[i::jobs] for i in range(jobs)]
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        downloaded = executor.map(
+            lambda files: download_acvp_files_batch(host, base_path, data_dir, files),
+            batches,
+        )
+        return all(list(downloaded))
 
-    return True
 
+def loadAcvpData(prompt, expectedResults, isAcvts=None):
+    """Load ACVP prompt and expected results.
 
-def loadAcvpData(prompt, expectedResults):
-    with open(prompt, "r") as f:
-        promptData = json.load(f)
+    isAcvts indicates whether the prompt uses the ACVTS data structure
+    (see runTestSingle()), or is None if this should be detected."""
+    with open(prompt, "rb") as f:
+        promptData = json_load(f)
     expectedResultsData = None
     if expectedResults is not None:
-        with open(expectedResults, "r") as f:
-            expectedResultsData = json.load(f)
+        with open(expectedResults, "rb") as f:
+            expectedResultsData = json_load(f)
 
-    return (prompt, promptData, expectedResults, expectedResultsData)
+    return (prompt, promptData, expectedResults, expectedResultsData, isAcvts)
 
 
 def loadDefaultAcvpData(version):
@@ -96,7 +240,8 @@ def loadDefaultAcvpData(version):
     ]
     acvp_data = []
     for prompt, expectedResults in acvp_jsons_for_version:
-        acvp_data.append(loadAcvpData(prompt, expectedResults))
+        # The usnistgov/ACVP-Server files never use the ACVTS data structure
+        acvp_data.append(loadAcvpData(prompt, expectedResults, isAcvts=False))
     return acvp_data
 
 
@@ -108,77 +253,155 @@ def info(msg, **kwargs):
     print(msg, **kwargs)
 
 
-def get_acvp_binary(tg):
-    """Convert JSON dict for ACVP test group to suitable ACVP binary."""
-    parameterSetToLevel = {
-        "ML-DSA-44": 44,
-        "ML-DSA-65": 65,
-        "ML-DSA-87": 87,
-    }
-    level = parameterSetToLevel[tg["parameterSet"]]
+parameterSetToLevel = {
+    "ML-DSA-44": 44,
+    "ML-DSA-65": 65,
+    "ML-DSA-87": 87,
+}
+
+
+@lru_cache(maxsize=8)
+def get_acvp_binary_for_parameter_set(parameterSet):
+    level = parameterSetToLevel[parameterSet]
     basedir = f"./test/build/mldsa{level}/bin"
     acvp_bin = f"acvp_mldsa{level}"
     return f"{basedir}/{acvp_bin}"
 
 
-def run_keyGen_test(tg, tc):
-    info(f"Running keyGen test case {tc['tcId']} ... ", end="")
+def get_acvp_binary(tg):
+    """Convert JSON dict for ACVP test group to suitable ACVP binary."""
+    return get_acvp_binary_for_parameter_set(tg["parameterSet"])
+
+
+class AcvpServer:
+    """Long-running `acvp_mldsa{lvl} server` process.
 
+    The server reads one command per line, with the arguments separated by
+    tabs, and terminates the output of each command by `END <rc>`."""
+
+    def __init__(self, acvp_bin):
+        self.proc = subprocess.Popen(
+            exec_prefix + [acvp_bin, "server"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            close_fds=acvp_close_fds,
+        )
+
+    def call(self, acvp_call):
+        """Run acvp_call = [acvp_bin, command, args...] on the server.
+
+        Returns the exit code and output of the command."""
+        self.proc.stdin.write(("\t".join(acvp_call[1:]) + "\n").encode("utf-8"))
+        self.proc.stdin.flush()
+        stdout = []
+        for l in self.proc.stdout:
+            if l.startswith(b"END "):
+                return (int(l[len(b"END ") :]), b"".join(stdout))
+            stdout.append(l)
+        # The server terminated, e.g., because of a failing CHECK()
+        returncode = self.proc.wait()
+        return (returncode if returncode != 0 else 1, b"".join(stdout))
+
+    def close(self):
+        self.proc.stdin.close()
+        self.proc.wait()
+
+
+# One server per ACVP binary and worker thread
+acvp_servers_local = threading.local()
+acvp_servers = []
+acvp_servers_lock = threading.Lock()
+
+
+def get_acvp_server(acvp_bin):
+    servers = getattr(acvp_servers_local, "servers", None)
+    if servers is None:
+        servers = acvp_servers_local.servers = {}
+    server = servers.get(acvp_bin)
+    if server is None or server.proc.poll() is not None:
+        server = servers[acvp_bin] = AcvpServer(acvp_bin)
+        with acvp_servers_lock:
+            acvp_servers.append(server)
+    return server
+
+
+def close_acvp_servers():
+    with acvp_servers_lock:
+        for server in acvp_servers:
+            server.close()
+        acvp_servers.clear()
+
+
+def run_acvp_call(acvp_call):
+    """Run acvp_call = [acvp_bin, command, args...].
+
+    Returns a subprocess.CompletedProcess with stdout and stderr as bytes.
+    In server mode, stderr is not captured but passed through.
+
+    Only without server mode are the (hex encoded) test data passed on the
+    command line. In server mode, they are streamed to the server's stdin,
+    so large messages and signatures are not copied into the argv of a new
+    process."""
+    if not use_acvp_server:
+        return subprocess.run(
+            exec_prefix + acvp_call, capture_output=True, close_fds=acvp_close_fds
+        )
+    (returncode, stdout) = get_acvp_server(acvp_call[0]).call(acvp_call)
+    return subprocess.CompletedProcess(acvp_call, returncode, stdout, b"")
+
+
+def run_keyGen_test(tg, tc):
     results = {"tcId": tc["tcId"]}
     acvp_bin = get_acvp_binary(tg)
     assert tg["testType"] == "AFT"
-    acvp_call = exec_prefix + [
+    acvp_call = [
         acvp_bin,
         "keyGen",
         f"seed={tc['seed']}",
     ]
-    result = subprocess.run(acvp_call, encoding="utf-8", capture_output=True)
+    result = run_acvp_call(acvp_call)
     if result.returncode != 0:
         err("FAIL!")
         err(f"{acvp_call} failed with error code {result.returncode}")
-        err(result.stderr)
+        err(result.stderr.decode("utf-8"))
         exit(1)
     # Extract results
-    for l in result.stdout.splitlines():
-        (k, v) = l.split("=")
-        results[k] = v
-    info("done")
+    for k, v in acvp_output_re.findall(result.stdout):
+        results[k.decode("utf-8")] = v.decode("utf-8")
+    info(f"Running keyGen test case {tc['tcId']} ... done")
     return results
 
 
+# Hash functions used for HashML-DSA, mapping the ACVP algorithm name to the
+# hashlib constructor and the arguments to hexdigest(), which for the XOFs
+# is the output length in bytes.
+HASH_ALGS = {
+    "SHA2-224": (hashlib.sha224, ()),
+    "SHA2-256": (hashlib.sha256, ()),
+    "SHA2-384": (hashlib.sha384, ()),
+    "SHA2-512": (hashlib.sha512, ()),
+    "SHA2-512/224": (partial(hashlib.new, "sha512_224"), ()),
+    "SHA2-512/256": (partial(hashlib.new, "sha512_256"), ()),
+    "SHA3-224": (hashlib.sha3_224, ()),
+    "SHA3-256": (hashlib.sha3_256, ()),
+    "SHA3-384": (hashlib.sha3_384, ()),
+    "SHA3-512": (hashlib.sha3_512, ()),
+    "SHAKE-128": (hashlib.shake_128, (32,)),
+    "SHAKE-256": (hashlib.shake_256, (64,)),
+}
+
+
+# ACVP prompts frequently reuse the same message across test cases
+@lru_cache(maxsize=4096)
 def compute_hash(msg, alg):
-    msg_bytes = bytes.fromhex(msg)
-
-    if alg == "SHA2-224":
-        return hashlib.sha224(msg_bytes).hexdigest()
-    elif alg == "SHA2-256":
-        return hashlib.sha256(msg_bytes).hexdigest()
-    elif alg == "SHA2-384":
-        return hashlib.sha384(msg_bytes).hexdigest()
-    elif alg == "SHA2-512":
-        return hashlib.sha512(msg_bytes).hexdigest()
-    elif alg == "SHA2-512/224":
-        return hashlib.new("sha512_224", msg_bytes).hexdigest()
-    elif alg == "SHA2-512/256":
-        return hashlib.new("sha512_256", msg_bytes).hexdigest()
-    elif alg == "SHA3-224":
-        return hashlib.sha3_224(msg_bytes).hexdigest()
-    elif alg == "SHA3-256":
-        return hashlib.sha3_256(msg_bytes).hexdigest()
-    elif alg == "SHA3-384":
-        return hashlib.sha3_384(msg_bytes).hexdigest()
-    elif alg == "SHA3-512":
-        return hashlib.sha3_512(msg_bytes).hexdigest()
-    elif alg == "SHAKE-128":
-        return hashlib.shake_128(msg_bytes).hexdigest(32)
-    elif alg == "SHAKE-256":
-        return hashlib.shake_256(msg_bytes).hexdigest(64)
-    else:
+    try:
+        (hash_ctor, digest_args) = HASH_ALGS[alg]
+    except KeyError:
         raise ValueError(f"Unsupported hash algorithm: {alg}")
+    return hash_ctor(bytes.fromhex(msg)).hexdigest(*digest_args)
 
 
 def run_sigGen_test(tg, tc):
-    info(f"Running sigGen test case {tc['tcId']} ... ", end="")
     results = {"tcId": tc["tcId"]}
     acvp_bin = get_acvp_binary(tg)
 
@@ -195,7 +418,7 @@ def run_sigGen_test(tg, tc):
                 if is_deterministic
                 else "sigGenPreHashShake256"
             )
-            acvp_call = exec_prefix + [
+            acvp_call = [
                 acvp_bin,
                 target,
                 f"message={tc['message']}",
@@ -207,7 +430,7 @@ def run_sigGen_test(tg, tc):
             target = (
                 "sigGenPreHashDeterministic" if is_deterministic else "sigGenPreHash"
             )
-            acvp_call = exec_prefix + [
+            acvp_call = [
                 acvp_bin,
                 target,
                 f"ph={ph}",
@@ -221,7 +444,7 @@ def run_sigGen_test(tg, tc):
         assert len(tc["message"]) <= 2 * 8192
 
         target = "sigGenDeterministic" if is_deterministic else "sigGen"
-        acvp_call = exec_prefix + [
+        acvp_call = [
             acvp_bin,
             target,
             f"message={tc['message']}",
@@ -240,7 +463,7 @@ def run_sigGen_test(tg, tc):
             msg = tc["message"]
 
         target = "sigGenInternalDeterministic" if is_deterministic else "sigGenInternal"
-        acvp_call = exec_prefix + [
+        acvp_call = [
             acvp_bin,
             target,
             f"message={msg}",
@@ -252,22 +475,20 @@ def run_sigGen_test(tg, tc):
     if not is_deterministic:
         acvp_call.append(f"rnd={tc['rnd']}")
 
-    result = subprocess.run(acvp_call, encoding="utf-8", capture_output=True)
+    result = run_acvp_call(acvp_call)
     if result.returncode != 0:
         err("FAIL!")
         err(f"{acvp_call} failed with error code {result.returncode}")
-        err(result.stderr)
+        err(result.stderr.decode("utf-8"))
         exit(1)
     # Extract results
-    for l in result.stdout.splitlines():
-        (k, v) = l.split("=")
-        results[k] = v
-    info("done")
+    for k, v in acvp_output_re.findall(result.stdout):
+        results[k.decode("utf-8")] = v.decode("utf-8")
+    info(f"Running sigGen test case {tc['tcId']} ... done")
     return results
 
 
 def run_sigVer_test(tg, tc):
-    info(f"Running sigVer test case {tc['tcId']} ... ", end="")
     results = {"tcId": tc["tcId"]}
     acvp_bin = get_acvp_binary(tg)
 
@@ -276,7 +497,7 @@ def run_sigVer_test(tg, tc):
 
         # Use specialized SHAKE256 function that computes hash internally
         if tc["hashAlg"] == "SHAKE-256":
-            acvp_call = exec_prefix + [
+            acvp_call = [
                 acvp_bin,
                 "sigVerPreHashShake256",
                 f"message={tc['message']}",
@@ -286,7 +507,7 @@ def run_sigVer_test(tg, tc):
             ]
         else:
             ph = compute_hash(tc["message"], tc["hashAlg"])
-            acvp_call = exec_prefix + [
+            acvp_call = [
                 acvp_bin,
                 "sigVerPreHash",
                 f"ph={ph}",
@@ -300,7 +521,7 @@ def run_sigVer_test(tg, tc):
         assert len(tc["context"]) <= 2 * 255
         assert len(tc["message"]) <= 2 * 8192
 
-        acvp_call = exec_prefix + [
+        acvp_call = [
             acvp_bin,
             "sigVer",
             f"message={tc['message']}",
@@ -319,7 +540,7 @@ def run_sigVer_test(tg, tc):
             assert len(tc["message"]) <= 2 * 8192
             msg = tc["message"]
 
-        acvp_call = exec_prefix + [
+        acvp_call = [
             acvp_bin,
             "sigVerInternal",
             f"message={msg}",
@@ -328,14 +549,57 @@ def run_sigVer_test(tg, tc):
             f"externalMu={externalMu}",
         ]
 
-    result = subprocess.run(acvp_call, encoding="utf-8", capture_output=True)
+    result = run_acvp_call(acvp_call)
     # Extract results
     results["testPassed"] = result.returncode == 0
-    info("done")
+    info(f"Running sigVer test case {tc['tcId']} ... done")
     return results
 
 
-def runTestSingle(promptName, prompt, expectedResultName, expectedResult, output):
+def ordered_equal(a, b):
+    """Structural equality that also requires dict keys to be in the same order.
+
+    This is equivalent to comparing the JSON serializations of a and b, but
+    avoids serializing potentially very large results."""
+    if type(a) is not type(b):
+        return False
+    if isinstance(a, dict):
+        if list(a.keys()) != list(b.keys()):
+            return False
+        return all(ordered_equal(a[k], b[k]) for k in a)
+    if isinstance(a, list):
+        if len(a) != len(b):
+            return False
+        return all(ordered_equal(x, y) for x, y in zip(a, b))
+    return a == b
+
+
+def index_test_results(results, isAcvts):
+    """Map (tgId, tcId) to the result of the respective test case.
+
+    Returns None if results do not have the expected structure, in which
+    case only the comparison of the complete results applies."""
+    if isAcvts is True:
+        if not isinstance(results, list) or len(results) != 2:
+            return None
+        results = results[1]
+    if not isinstance(results, dict) or not isinstance(results.get("testGroups"), list):
+        return None
+
+    index = {}
+    for tg in results["testGroups"]:
+        if not isinstance(tg, dict) or not isinstance(tg.get("tests"), list):
+            return None
+        for tc in tg["tests"]:
+            if not isinstance(tc, dict):
+                return None
+            index[(tg.get("tgId"), tc.get("tcId"))] = tc
+    return index
+
+
+def runTestSingle(
+    promptName, prompt, expectedResultName, expectedResult, isAcvts, output
+):
     info(f"Running ACVP tests for {promptName}")
 
     assert expectedResult is not None or output is not None
@@ -346,10 +610,11 @@ def runTestSingle(promptName, prompt, expectedResultName, expectedResult, output
     # solely consisting of {"acvVersion": "1.0"} and the second element is
     # the usual prompt containing the test values.
     # See https://pages.nist.gov/ACVP/draft-celi-acvp-ml-dsa.txt for details.
-    # We automatically detect that case here and extract the second element
-    isAcvts = False
-    if type(prompt) is list:
-        isAcvts = True
+    # Unless known from where the prompt was loaded, we automatically detect
+    # that case here and extract the second element
+    if isAcvts is None:
+        isAcvts = isinstance(prompt, list)
+    if isAcvts is True:
         assert len(prompt) == 2
         acvVersion = prompt[0]
         assert len(acvVersion) == 1
@@ -365,21 +630,62 @@ def runTestSingle(promptName, prompt, expectedResultName, expectedResult, output
     # copy top level fields into the results
     results = prompt.copy()
 
-    results["testGroups"] = []
-    for tg in prompt["testGroups"]:
-        tgResult = {
-            "tgId": tg["tgId"],
-            "tests": [],
-        }
-        results["testGroups"].append(tgResult)
-        for tc in tg["tests"]:
-            if prompt["mode"] == "keyGen":
-                result = run_keyGen_test(tg, tc)
-            elif prompt["mode"] == "sigGen":
-                result = run_sigGen_test(tg, tc)
-            elif prompt["mode"] == "sigVer":
-                result = run_sigVer_test(tg, tc)
-            tgResult["tests"].append(result)
+    # Index the expected results by test case, so that every result can be
+    # checked as soon as it is available
+    expectedTests = None
+    if expectedResult is not None:
+        expectedTests = index_test_results(expectedResult, isAcvts)
+
+    if prompt["mode"] == "keyGen":
+        run_test = run_keyGen_test
+    elif prompt["mode"] == "sigGen":
+        run_test = run_sigGen_test
+    elif prompt["mode"] == "sigVer":
+        run_test = run_sigVer_test
+
+    # The test cases are independent of each other and spend most of their
+    # time waiting for the acvp_mldsa{lvl} subprocess, so run them
+    # concurrently. executor.map() yields the results in submission order.
+    testCases = [(tg, tc) for tg in prompt["testGroups"] for tc in tg["tests"]]
+    mismatch = None
+    executor = ThreadPoolExecutor(max_workers=os.cpu_count())
+    try:
+        tcResults = executor.map(lambda t: run_test(*t), testCases)
+
+        results["testGroups"] = []
+        for tg in prompt["testGroups"]:
+            # The number of results per test group is known upfront
+            tests = [None] * len(tg["tests"])
+            tgResult = {
+                "tgId": tg["tgId"],
+                "tests": tests,
+            }
+            results["testGroups"].append(tgResult)
+            for i, tc in enumerate(tg["tests"]):
+                tests[i] = next(tcResults)
+                # Fail fast on the first mismatching test case
+                if expectedTests is not None and not ordered_equal(
+                    tests[i], expectedTests.get((tg["tgId"], tc["tcId"]))
+                ):
+                    mismatch = (tg["tgId"], tc["tcId"])
+                    break
+            if mismatch is not None:
+                break
+    finally:
+        # Don't wait for pending test cases if one of them failed
+        executor.shutdown(cancel_futures=True)
+        close_acvp_servers()
+
+    # Report a mismatch only once the running test cases have finished, so
+    # that it is not followed by their progress output
+    if mismatch is not None:
+        (tgId, tcId) = mismatch
+        err("FAIL!")
+        err(
+            f"Mismatching result for test case {tcId} of test group {tgId} "
+            f"in {promptName}"
+        )
+        exit(1)
 
     # In case the testvectors are from the ACVTS server, it is expected
     # that the acvVersion is included in the output results.
@@ -390,9 +696,10 @@ def runTestSingle(promptName, prompt, expectedResultName, expectedResult, output
     # Compare to expected results
     if expectedResult is not None:
         info(f"Comparing results with {expectedResultName}")
-        # json.dumps() is guaranteed to preserve insertion order (since Python 3.7)
+        # All test cases match, but check the complete results as well, e.g.,
+        # for the top level fields.
         # Enforce strictly the same order as in the expected Result
-        if json.dumps(results) != json.dumps(expectedResult):
+        if not ordered_equal(results, expectedResult):
             err("FAIL!")
             err(f"Mismatching result for {promptName}")
             exit(1)
@@ -405,16 +712,18 @@ def runTestSingle(promptName, prompt, expectedResultName, expectedResult, output
     # Write results to file
     if output is not None:
         info(f"Writing results to {output}")
-        with open(output, "w") as f:
-            json.dump(results, f)
+        with open(output, "wb") as f:
+            json_dump(results, f)
 
 
 def runTest(data, output):
     # if output is defined we expect only one input
     assert output is None or len(data) == 1
 
-    for promptName, prompt, expectedResultName, expectedResult in data:
-        runTestSingle(promptName, prompt, expectedResultName, expectedResult, output)
+    for promptName, prompt, expectedResultName, expectedResult, isAcvts in data:
+        runTestSingle(
+            promptName, prompt, expectedResultName, expectedResult, isAcvts, output
+        )
     info("ALL GOOD!")
 
 
@@ -456,7 +765,14 @@ parser.add_argument(
     default="v1.1.0.41",
     help="ACVP test vector version (default: v1.1.0.41)",
 )
+parser.add_argument(
+    "--no-server",
+    action="store_true",
+    help="Spawn a new acvp_mldsa{lvl} process for every test case instead of "
+    "keeping server processes running (required on baremetal platforms)",
+)
 args = parser.parse_args()
+use_acvp_server = not args.no_server
 
 if args.prompt is None:
     print(f"Using ACVP test vectors version {args.version}", file=sys.stderr)
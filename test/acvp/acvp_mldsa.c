@@ -26,6 +26,7 @@
   MLD_API_NAMESPACE(verify_pre_hash_shake256)
 
 #define USAGE "acvp_mldsa{lvl} [keyGen|sigGen|sigVer] {test specific arguments}"
+#define SERVER_USAGE "acvp_mldsa{lvl} server"
 #define KEYGEN_USAGE "acvp_mldsa{lvl} keyGen seed=HEX"
 #define SIGGEN_USAGE \
   "acvp_mldsa{lvl} sigGen message=HEX sk=HEX context=HEX rnd=HEX"
@@ -65,6 +66,11 @@
 #define MAX_MSG_LENGTH 8192
 /* maximum context length according to FIPS-204 */
 #define MAX_CTX_LENGTH 255
+/* maximum length of a request line in server mode, including all hex
+ * encoded arguments */
+#define MAX_LINE_LENGTH 65536
+/* maximum number of arguments of a request in server mode */
+#define MAX_ARGS 8
 
 #define CHECK(x)                                              \
   do                                                          \
@@ -520,16 +526,12 @@ static int acvp_mldsa_sigGenPreHashShake256Deterministic_AFT(
 }
 
 
-int main(int argc, char *argv[])
+/* Run a single ACVP command. argv[0] is the command name, followed by its
+ * test specific arguments. */
+static int acvp_run(int argc, char *argv[])
 {
   acvp_mode mode;
 
-  if (argc == 0)
-  {
-    goto usage;
-  }
-  argc--, argv++;
-
   if (argc == 0)
   {
     goto usage;
@@ -1304,3 +1306,83 @@ sigver_prehash_shake256_usage:
   fprintf(stderr, SIGVER_PREHASH_SHAKE256_USAGE "\n");
   return (1);
 }
+
+#if !defined(SEMIHOSTING)
+/*
+ * Server mode: Read commands from stdin, one per line, with the command name
+ * and its arguments separated by tabs. For each command, the output is
+ * followed by a line `END <rc>` with rc being the exit code the command would
+ * have returned when invoked on the command line.
+ *
+ * This avoids spawning a new process for every single test case.
+ * It is not available on baremetal platforms which have no stdin.
+ */
+static int acvp_server(void)
+{
+  static char line[MAX_LINE_LENGTH];
+
+  while (fgets(line, sizeof(line), stdin) != NULL)
+  {
+    char *args[MAX_ARGS];
+    char *p = line;
+    size_t len = strlen(line);
+    int nargs = 0;
+    int rc;
+
+    if (len == 0 || line[len - 1] != '\n')
+    {
+      fprintf(stderr, "Request exceeds maximum length of %u bytes\n",
+              (unsigned)MAX_LINE_LENGTH);
+      return 1;
+    }
+    line[len - 1] = '\0';
+
+    /* Split line into tab-separated arguments */
+    while (p != NULL && nargs < MAX_ARGS)
+    {
+      args[nargs++] = p;
+      p = strchr(p, '\t');
+      if (p != NULL)
+      {
+        *p++ = '\0';
+      }
+    }
+    if (p != NULL)
+    {
+      fprintf(stderr, "Request exceeds maximum of %u arguments\n",
+              (unsigned)MAX_ARGS);
+      return 1;
+    }
+
+    rc = acvp_run(nargs, args);
+    printf("END %d\n", rc);
+    fflush(stdout);
+  }
+
+  return 0;
+}
+#endif /* !SEMIHOSTING */
+
+int main(int argc, char *argv[])
+{
+  if (argc == 0)
+  {
+    fprintf(stderr, USAGE "\n");
+    return (1);
+  }
+  argc--, argv++;
+
+#if !defined(SEMIHOSTING)
+  if (argc > 0 && strcmp(*argv, "server") == 0)
+  {
+    if (argc != 1)
+    {
+      fprintf(stderr, SERVER_USAGE "\n");
+      return (1);
+    }
+    return acvp_server();
+  }
+#endif /* !SEMIHOSTING */
+
+  return acvp_run(argc, argv);
+}
@@ -44,3 +44,6 @@ EXTRA_SOURCES = $(wildcard $(PLATFORM_PATH)/*.c) $(wildcard $(PLATFORM_PATH)/*.S
 EXTRA_SOURCES_CFLAGS = -Wno-conversion -Wno-sign-conversion
 
 EXEC_WRAPPER := $(realpath $(PLATFORM_PATH)/exec_wrapper.py)
+
+# No stdin on baremetal: Run every ACVP test case in a separate process
+ACVP_NO_SERVER = 1
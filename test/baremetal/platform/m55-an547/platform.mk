@@ -71,3 +71,6 @@ EXTRA_SOURCES = $(wildcard $(M55_AN547_PATH)/*.c)
 EXTRA_SOURCES_CFLAGS = -Wno-conversion -Wno-sign-conversion
 
 EXEC_WRAPPER := $(realpath $(PLATFORM_PATH)/exec_wrapper.py)
+
+# No stdin on baremetal: Run every ACVP test case in a separate process
+ACVP_NO_SERVER = 1